@@ -12,10 +12,10 @@ from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     timestamp: float
-    message: str
+    delta: float
 
 
 # TODO(Kyle): Support Cryptos other than ETH
@@ -29,9 +29,15 @@ class WalletCoinbase(FuserInput[float]):
 
         # Track IO
         self.io_provider = IOProvider()
-        self.messages: List[Message] = []
+        # Received ETH not yet reported, and the time of the latest transfer
+        self._pending_sum: float = 0.0
+        self._pending_ts: float = 0.0
 
         self.POLL_INTERVAL = 0.5  # seconds between blockchain data updates
+        # While the balance is unchanged the interval doubles per poll, up to
+        # POLL_INTERVAL * MAX_IDLE_MULTIPLIER, and resets on the next change
+        self.MAX_IDLE_MULTIPLIER = 16
+        self._idle_multiplier = 1
         self.COINBASE_WALLET_ID = os.environ.get("COINBASE_WALLET_ID")
         logging.info(f"Using {self.COINBASE_WALLET_ID} as the coinbase wallet id")
 
@@ -62,16 +68,16 @@ class WalletCoinbase(FuserInput[float]):
 
         logging.info("Testing: WalletCoinbase: Initialized")
 
-    async def _poll(self) -> List[float]:
+    async def _poll(self) -> Optional[List[float]]:
         """
         Poll for Coinbase Wallet balance updates.
 
         Returns
         -------
-        List[float]
-            [current_balance, balance_change]
+        Optional[List[float]]
+            [current_balance, balance_change], or None if the balance is unchanged
         """
-        await asyncio.sleep(self.POLL_INTERVAL)
+        await asyncio.sleep(self.POLL_INTERVAL * self._idle_multiplier)
 
         # randomly simulate ETH inbound transfers for debugging purposes
         # if random.randint(0, 10) > 7:
@@ -79,16 +85,41 @@ class WalletCoinbase(FuserInput[float]):
         #     faucet_transaction.wait()
         #     logging.info(f"WalletCoinbase: Faucet transaction: {faucet_transaction}")
 
-        self.wallet = Wallet.fetch(self.COINBASE_WALLET_ID)  # type: ignore
-        logging.info(
-            f"WalletCoinbase: Wallet refreshed: {self.wallet.balance('eth')}, the current balance is {self.ETH_balance}"
-        )
-        self.ETH_balance = float(self.wallet.balance("eth"))
+        # The CDP SDK only offers blocking HTTP calls, so run them in a worker
+        # thread instead of stalling every other input on the event loop
+        self.ETH_balance = await asyncio.to_thread(self._fetch_balance)
         balance_change = self.ETH_balance - self.ETH_balance_previous
         self.ETH_balance_previous = self.ETH_balance
 
+        if balance_change == 0:
+            self._idle_multiplier = min(
+                self._idle_multiplier * 2, self.MAX_IDLE_MULTIPLIER
+            )
+            return None
+
+        self._idle_multiplier = 1
         return [self.ETH_balance, balance_change]
 
+    def _fetch_balance(self) -> float:
+        """
+        Refresh the wallet and read its ETH balance.
+
+        Blocks on the Coinbase API; call it from a worker thread.
+
+        Returns
+        -------
+        float
+            Current ETH balance
+        """
+        self.wallet = Wallet.fetch(self.COINBASE_WALLET_ID)  # type: ignore
+        balance = self.wallet.balance("eth")
+        logging.info(
+            "WalletCoinbase: Wallet refreshed: %s, the current balance is %s",
+            balance,
+            self.ETH_balance,
+        )
+        return float(balance)
+
     async def _raw_to_text(self, raw_input: List[float]) -> Optional[Message]:
         """
         Convert balance data to human-readable message.
@@ -105,30 +136,29 @@ class WalletCoinbase(FuserInput[float]):
         """
         balance_change = raw_input[1]
 
-        message = ""
-
-        if balance_change > 0:
-            message = f"{balance_change:.5f}"
-            logging.info(f"\n\nWalletCoinbase balance change: {message}")
-        else:
+        if balance_change <= 0:
             return None
 
-        logging.debug(f"WalletCoinbase: {message}")
-        return Message(timestamp=time.time(), message=message)
+        logging.info("\n\nWalletCoinbase balance change: %.5f", balance_change)
+        return Message(timestamp=time.time(), delta=balance_change)
 
-    async def raw_to_text(self, raw_input: List[float]):
+    async def raw_to_text(self, raw_input: Optional[List[float]]):
         """
-        Process balance update and manage message buffer.
+        Process balance update and accumulate received ETH.
 
         Parameters
         ----------
-        raw_input : List[float]
-            Raw balance data
+        raw_input : Optional[List[float]]
+            Raw balance data, or None if the balance is unchanged
         """
+        if raw_input is None:
+            return
+
         pending_message = await self._raw_to_text(raw_input)
 
         if pending_message is not None:
-            self.messages.append(pending_message)
+            self._pending_sum += pending_message.delta
+            self._pending_ts = pending_message.timestamp
 
     def formatted_latest_buffer(self) -> Optional[str]:
         """
@@ -140,30 +170,22 @@ class WalletCoinbase(FuserInput[float]):
         Optional[str]
             Formatted string of buffer contents or None if buffer is empty
         """
-        if len(self.messages) == 0:
+        # only positive deltas are accumulated, so zero means nothing pending
+        if self._pending_sum <= 0:
             return None
 
-        transaction_sum = 0
+        transaction_sum = self._pending_sum
+        timestamp = self._pending_ts
+        self._pending_sum = 0.0
 
-        # all the messages, by definition, are non-zero
-        for message in self.messages:
-            transaction_sum += float(message.message)
-
-        last_message = self.messages[-1]
-        result_message = Message(
-            timestamp=last_message.timestamp,
-            message=f"You just received {transaction_sum:.5f} ETH.",
-        )
+        message = f"You just received {transaction_sum:.5f} ETH."
 
         result = f"""
 {self.__class__.__name__} INPUT
 // START
-{result_message.message}
+{message}
 // END
 """
 
-        self.io_provider.add_input(
-            self.__class__.__name__, result_message.message, result_message.timestamp
-        )
-        self.messages = []
+        self.io_provider.add_input(self.__class__.__name__, message, timestamp)
         return result
@@ -1,19 +1,62 @@
 import asyncio
+import itertools
 import logging
 import os
 import random
 import time
+from collections import deque
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Deque, Dict, List, Optional
+from urllib.parse import urlparse
 
-from web3 import Web3
+from web3 import AsyncHTTPProvider, AsyncWeb3, WebSocketProvider
 
 from inputs.base import SensorConfig
 from inputs.base.loop import FuserInput
 from providers.io_provider import IOProvider
 
+_WEI_PER_ETH = 10**18
 
-@dataclass
+# Inputs are rebuilt on config reloads and mode switches. Sharing one client per
+# endpoint keeps a single HTTP session or WebSocket open instead of a new one
+# for every WalletEthereum instance.
+_WEB3_CLIENTS: Dict[str, AsyncWeb3] = {}
+# One lock per endpoint serializes connect/teardown of the shared WebSocket.
+# Each open socket gets a new id, so a poll that failed on an old socket cannot
+# tear down the one that replaced it.
+_CONNECT_LOCKS: Dict[str, asyncio.Lock] = {}
+_CONNECTED_SOCKETS: Dict[str, int] = {}
+_SOCKET_IDS = itertools.count(1)
+
+
+def _get_web3(provider_url: str) -> AsyncWeb3:
+    """
+    Get the shared AsyncWeb3 client for an endpoint, creating it on first use.
+
+    ws:// and wss:// endpoints keep one socket open for every RPC instead of
+    paying an HTTP request per call.
+
+    Parameters
+    ----------
+    provider_url : str
+        HTTP(S) or WebSocket RPC endpoint
+
+    Returns
+    -------
+    AsyncWeb3
+        Client bound to the endpoint
+    """
+    web3 = _WEB3_CLIENTS.get(provider_url)
+    if web3 is None:
+        if urlparse(provider_url).scheme in ("ws", "wss"):
+            web3 = AsyncWeb3(WebSocketProvider(provider_url))
+        else:
+            web3 = AsyncWeb3(AsyncHTTPProvider(provider_url))
+        _WEB3_CLIENTS[provider_url] = web3
+    return web3
+
+
+@dataclass(slots=True)
 class Message:
     """
     Container for timestamped messages.
@@ -35,12 +78,8 @@ class WalletEthereum(FuserInput[float]):
     Ethereum wallet monitor that tracks ETH balance changes.
 
     Queries the Ethereum blockchain for account balance updates and reports
-    incoming transactions.
-
-    Raises
-    ------
-    Exception
-        If connection to Ethereum network fails
+    incoming transactions. RPC failures are logged and the previous balance
+    is reported until the connection recovers.
     """
 
     def __init__(self, config: SensorConfig = SensorConfig()):
@@ -53,25 +92,72 @@ class WalletEthereum(FuserInput[float]):
         self.io_provider = IOProvider()
 
         self.ETH_balance = 0
-        self.ETH_balance_previous = 0
         self.balance_eth = 0
+        # Balances are tracked in integer wei and only converted to ETH on output
+        self.balance_wei = 0
+        self.balance_wei_previous = 0
         self.balance_change = 0
+        self.block_number: Optional[int] = None
+        # Id of the shared socket this instance last polled on
+        self._socket_id: Optional[int] = None
 
-        self.messages: list[Message] = []
+        # Only the latest message is ever reported
+        self.messages: Deque[Message] = deque(maxlen=1)
         self.eth_info = ""
 
-        self.PROVIDER_URL = "https://eth.llamarpc.com"
+        self.PROVIDER_URL = getattr(
+            self.config, "provider_url", "https://eth.llamarpc.com"
+        )
         self.POLL_INTERVAL = 4  # seconds between blockchain data updates
-        self.ACCOUNT_ADDRESS = os.environ.get(
-            "ETH_ADDRESS", "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045"
+        # web3 rejects non-checksummed addresses, so normalize once up front
+        self.ACCOUNT_ADDRESS = AsyncWeb3.to_checksum_address(
+            os.environ.get("ETH_ADDRESS", "0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045")
         )
         logging.debug(f"Using {self.ACCOUNT_ADDRESS} as the wallet address")
         logging.info("Testing: WalletEthereum: Initialized")
 
-        # Initialize Web3
-        self.web3 = Web3(Web3.HTTPProvider(self.PROVIDER_URL))
-        if not self.web3.is_connected():
-            raise Exception("Failed to connect to Ethereum")
+        # Initialize Web3; RPCs are awaited directly so polling never blocks the loop.
+        # WebSocket connections are opened on the first poll.
+        self.web3 = _get_web3(self.PROVIDER_URL)
+
+    async def _ensure_connected(self) -> None:
+        """
+        Open the persistent WebSocket connection if it is not open yet.
+
+        Instances sharing the socket wait on the endpoint lock, so RPCs are only
+        sent once the connect has finished. HTTP providers are stateless and
+        need no setup.
+        """
+        provider = self.web3.provider
+        if not provider.has_persistent_connection:
+            return
+
+        async with _CONNECT_LOCKS.setdefault(self.PROVIDER_URL, asyncio.Lock()):
+            if self.PROVIDER_URL not in _CONNECTED_SOCKETS:
+                try:
+                    await provider.connect()
+                except Exception:
+                    # Clean up whatever the failed attempt left behind
+                    await provider.disconnect()
+                    raise
+                _CONNECTED_SOCKETS[self.PROVIDER_URL] = next(_SOCKET_IDS)
+            self._socket_id = _CONNECTED_SOCKETS[self.PROVIDER_URL]
+
+    async def _release_connection(self) -> None:
+        """
+        Close the shared WebSocket after a failed poll so the next one reconnects.
+
+        Any instance may close it, unless another one already replaced the
+        socket this poll used.
+        """
+        if not self.web3.provider.has_persistent_connection:
+            return
+
+        async with _CONNECT_LOCKS.setdefault(self.PROVIDER_URL, asyncio.Lock()):
+            socket_id = _CONNECTED_SOCKETS.get(self.PROVIDER_URL)
+            if socket_id is not None and socket_id == self._socket_id:
+                del _CONNECTED_SOCKETS[self.PROVIDER_URL]
+                await self.web3.provider.disconnect()
 
     async def _poll(self) -> List[float]:
         """
@@ -85,38 +171,52 @@ class WalletEthereum(FuserInput[float]):
         await asyncio.sleep(self.POLL_INTERVAL)
 
         try:
+            await self._ensure_connected()
+
             # Get latest block data
-            block_number = self.web3.eth.block_number
-
-            # Get account data
-            balance_wei = self.web3.eth.get_balance(self.ACCOUNT_ADDRESS)  # type: ignore
-            self.balance_eth = float(self.web3.from_wei(balance_wei, "ether"))
-
-            self.eth_info = {
-                "block_number": int(block_number),
-                "address": str(
-                    self.ACCOUNT_ADDRESS
-                ),  # that's a string prefixed with `0x`
-                "balance": self.balance_eth,
-            }
-            logging.debug(
-                f"Block: {self.eth_info['block_number']}, Account Balance: {self.eth_info['balance']:.3f} ETH"
-            )
+            block_number = await self.web3.eth.block_number
+
+            # The balance can only change in a new block, so only query it when
+            # the chain head has moved since the last poll
+            if block_number != self.block_number:
+                balance_wei = await self.web3.eth.get_balance(
+                    self.ACCOUNT_ADDRESS, block_number
+                )
+                self.block_number = block_number
+                self.balance_wei = balance_wei
+                self.balance_eth = balance_wei / _WEI_PER_ETH
+
+                self.eth_info = {
+                    "block_number": int(block_number),
+                    "address": str(
+                        self.ACCOUNT_ADDRESS
+                    ),  # that's a string prefixed with `0x`
+                    "balance": self.balance_eth,
+                }
+                logging.debug(
+                    "Block: %d, Account Balance: %.3f ETH",
+                    block_number,
+                    self.balance_eth,
+                )
 
             # randomly simulate ETH inbound transfers for debugging purposes
             random_add_for_debugging = 0
             dice = random.randint(0, 10)
-            logging.debug(f"WalletEthereum: dice {dice}")
+            logging.debug("WalletEthereum: dice %d", dice)
             if dice > 7:
                 logging.info("WalletEthereum: randomly adding 1.0 ETH")
-                random_add_for_debugging = 1.0
+                random_add_for_debugging = _WEI_PER_ETH
+
+            current_wei = self.balance_wei + random_add_for_debugging
+            change_wei = current_wei - self.balance_wei_previous
+            self.balance_wei_previous = current_wei
 
-            self.ETH_balance = self.balance_eth + random_add_for_debugging
-            self.balance_change = self.ETH_balance - self.ETH_balance_previous
-            self.ETH_balance_previous = self.ETH_balance
+            self.ETH_balance = current_wei / _WEI_PER_ETH
+            self.balance_change = change_wei / _WEI_PER_ETH
 
         except Exception as e:
             logging.error(f"Error fetching blockchain data: {e}")
+            await self._release_connection()
 
         # use the old values if the try fails, otherwise use the new/updated values
         return [self.ETH_balance, self.balance_change]
@@ -140,7 +240,7 @@ class WalletEthereum(FuserInput[float]):
 
         if balance_change > 0:
             message = f"You just received {balance_change:.3f} ETH."
-            logging.debug(f"WalletEthereum: {message}")
+            logging.debug("WalletEthereum: %s", message)
             return Message(timestamp=time.time(), message=message)
 
         return None
@@ -183,5 +283,5 @@ class WalletEthereum(FuserInput[float]):
         self.io_provider.add_input(
             self.__class__.__name__, latest_message.message, latest_message.timestamp
         )
-        self.messages = []
+        self.messages.clear()
         return result
@@ -1,92 +1,31 @@
 import asyncio
+import functools
+import hashlib
+import json
 import logging
 import os
 import threading
 import time
-from dataclasses import asdict, dataclass
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from typing import Dict, List, Optional
 
 import uvicorn
-from fastapi import FastAPI, WebSocket
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, WebSocket
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from llm.output_model import Action
-from providers.io_provider import Input, IOProvider
+from providers.io_provider import IOProvider
 from simulators.base import Simulator, SimulatorConfig
 
-
-@dataclass
-class SimulatorState:
-    inputs: dict
-    current_action: str = "idle"
-    last_speech: str = ""
-    current_emotion: str = ""
-    system_latency: Optional[dict] = None
-
-    def to_dict(self):
-        return asdict(self)
-
-
-class WebSim(Simulator):
-    """
-    WebSim simulator class for visualizing simulation data in a web interface.
-    """
-
-    def __init__(self, config: SimulatorConfig):
-        super().__init__(config)
-        self.messages: list[str] = []
-        self.io_provider = IOProvider()
-
-        self._initialized = False
-        self._lock = threading.Lock()
-        self._last_tick = time.time()
-        self._tick_interval = 0.1  # 100ms tick rate
-
-        self.state_dict = {}
-        # Initialize state
-        self.state = SimulatorState(
-            inputs={},
-            current_action="idle",
-            last_speech="",
-            current_emotion="",
-            system_latency={
-                "fuse_time": 0,
-                "llm_start": 0,
-                "processing": 0,
-                "complete": 0,
-            },
-        )
-
-        logging.info("Initializing WebSim...")
-
-        # Initialize FastAPI app
-        self.app = FastAPI()
-
-        # Mount assets directory
-        assets_path = os.path.join(os.path.dirname(__file__), "assets")
-        if not os.path.exists(assets_path):
-            os.makedirs(assets_path)
-        self.app.mount("/assets", StaticFiles(directory=assets_path), name="assets")
-
-        # Ensure the logo exists in assets directory
-        logo_path = os.path.join(assets_path, "OM_Logo_b_transparent.png")
-        if not os.path.exists(logo_path):
-            logging.warning(f"Logo not found at {logo_path}")
-
-        self.active_connections: List[WebSocket] = []
-
-        # Setup routes
-        @self.app.get("/")
-        async def get_index():
-            return HTMLResponse(
-                """
+_INDEX_HTML = """
             <!DOCTYPE html>
             <html>
                 <head>
                     <title>OpenMind Simulator</title>
-                    <script src="https://unpkg.com/react@17/umd/react.development.js"></script>
-                    <script src="https://unpkg.com/react-dom@17/umd/react-dom.development.js"></script>
+                    <script src="https://unpkg.com/react@17/umd/react.production.min.js"></script>
+                    <script src="https://unpkg.com/react-dom@17/umd/react-dom.production.min.js"></script>
                     <script src="https://unpkg.com/babel-standalone@6/babel.min.js"></script>
                     <link href="https://cdn.jsdelivr.net/npm/tailwindcss@2.2.19/dist/tailwind.min.css" rel="stylesheet">
                     <style>
@@ -216,7 +155,7 @@ class WebSim(Simulator):
                     <script type="text/babel">
                         function App() {
                             const [state, setState] = React.useState({
-                                inputs: {},
+                                inputs: { input_type: [], timestamp: [], input: [] },
                                 current_action: "idle",
                                 last_speech: "",
                                 current_emotion: "",
@@ -259,6 +198,8 @@ class WebSim(Simulator):
 
                             React.useEffect(() => {
                                 const ws = new WebSocket(`ws://${window.location.host}/ws`);
+                                ws.binaryType = 'arraybuffer';
+                                const decoder = new TextDecoder();
 
                                 ws.onopen = () => {
                                     console.log('Connected to WebSocket');
@@ -266,8 +207,15 @@ class WebSim(Simulator):
                                 };
 
                                 ws.onmessage = (event) => {
-                                    const data = JSON.parse(event.data);
-                                    setState(data);
+                                    // A message may carry several frames, one JSON object per line
+                                    for (const line of decoder.decode(event.data).split('\\n')) {
+                                        const frame = JSON.parse(line);
+                                        if (frame.type === 'patch') {
+                                            setState(prev => ({ ...prev, ...frame.state }));
+                                        } else {
+                                            setState(frame.state);
+                                        }
+                                    }
                                 };
 
                                 ws.onerror = (error) => {
@@ -297,12 +245,18 @@ class WebSim(Simulator):
 
                             const groupedMessages = React.useMemo(() => {
                                 const groups = {};
-                                Object.entries(state.inputs || {}).forEach(([key, value]) => {
-                                    const inputType = value.input_type || 'Unknown';
+                                const inputs = state.inputs || {};
+                                (inputs.input_type || []).forEach((type, index) => {
+                                    const inputType = type || 'Unknown';
                                     if (!groups[inputType]) {
                                         groups[inputType] = [];
                                     }
-                                    groups[inputType].push({ id: key, ...value });
+                                    groups[inputType].push({
+                                        id: index,
+                                        input_type: inputType,
+                                        timestamp: inputs.timestamp[index],
+                                        input: inputs.input[index]
+                                    });
                                 });
                                 return groups;
                             }, [state.inputs]);
@@ -459,29 +413,169 @@ class WebSim(Simulator):
                 </body>
             </html>
             """
-            )
+_INDEX_BODY = _INDEX_HTML.encode("utf-8")
+_INDEX_ETAG = f'"{hashlib.blake2b(_INDEX_BODY, digest_size=8).hexdigest()}"'
+_INDEX_HEADERS = {"ETag": _INDEX_ETAG, "Cache-Control": "no-cache"}
+
+
+# Inputs whose timestamps do not count towards the earliest input time
+_UNANCHORED_INPUTS = ("GovernanceEthereum", "Universal Laws")
+
+# SimulatorState field updated by each action type
+_ACTION_FIELDS = {
+    "move": "current_action",
+    "speak": "last_speech",
+    "emotion": "current_emotion",
+}
+
+# Frames buffered per client; a full queue is cleared and replaced with one
+# snapshot of the latest state
+_SEND_QUEUE_SIZE = 16
+
+
+@functools.lru_cache(maxsize=1)
+def _assets_path() -> str:
+    """Resolve the assets directory, creating it and checking the logo once"""
+    assets_path = os.path.join(os.path.dirname(__file__), "assets")
+    os.makedirs(assets_path, exist_ok=True)
+
+    # Ensure the logo exists in assets directory
+    logo_path = os.path.join(assets_path, "OM_Logo_b_transparent.png")
+    if not os.path.exists(logo_path):
+        logging.warning(f"Logo not found at {logo_path}")
+    return assets_path
+
+
+class _NotifyingServer(uvicorn.Server):
+    """uvicorn server that sets an event once its sockets are listening"""
+
+    def __init__(self, config: uvicorn.Config, ready: threading.Event):
+        super().__init__(config)
+        self._ready = ready
+
+    async def startup(self, sockets=None):
+        await super().startup(sockets=sockets)
+        if self.started:
+            self._ready.set()
+
+
+@dataclass(slots=True)
+class SimulatorState:
+    inputs: dict
+    current_action: str = "idle"
+    last_speech: str = ""
+    current_emotion: str = ""
+    system_latency: Optional[dict] = None
+
+    def to_dict(self):
+        # Shallow on purpose: the dict is serialized straight away, so the
+        # nested containers do not need the deep copy asdict() makes
+        return {
+            "inputs": self.inputs,
+            "current_action": self.current_action,
+            "last_speech": self.last_speech,
+            "current_emotion": self.current_emotion,
+            "system_latency": self.system_latency,
+        }
+
+
+class WebSim(Simulator):
+    """
+    WebSim simulator class for visualizing simulation data in a web interface.
+    """
+
+    def __init__(self, config: SimulatorConfig):
+        super().__init__(config)
+        self.messages: list[str] = []
+        self.io_provider = IOProvider()
+
+        self._initialized = False
+        self._last_tick = 0.0  # time.monotonic() of the last broadcast
+        self._tick_interval = 0.1  # 100ms tick rate
+        # Set by every sim() call; tick() broadcasts at most once per tick
+        # interval, so bursts of updates collapse into one frame
+        self._dirty = threading.Event()
+        # Event loop of the uvicorn thread, which owns the websockets
+        self._server_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Initialize state
+        self.state = SimulatorState(
+            inputs={"input_type": [], "timestamp": [], "input": []},
+            current_action="idle",
+            last_speech="",
+            current_emotion="",
+            system_latency={
+                "fuse_time": 0,
+                "llm_start": 0,
+                "processing": 0,
+                "complete": 0,
+            },
+        )
+
+        self.state_dict = self.state.to_dict()
+        # Clients get a full snapshot on connect and then patches holding only
+        # the top-level keys that changed; _sent_state is what they last saw.
+        # Only touched on the server loop.
+        self._version = 0
+        self._sent_state = self.state_dict
+        self._snapshot_payload = self._encode_frame("snapshot", 0, self._sent_state)
+        self._snapshot_version = 0
+
+        logging.info("Initializing WebSim...")
+
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            self._server_loop = asyncio.get_running_loop()
+            yield
+
+        # Initialize FastAPI app
+        self.app = FastAPI(lifespan=lifespan)
+
+        # Mount assets directory
+        self.app.mount("/assets", StaticFiles(directory=_assets_path()), name="assets")
+
+        # Each client has a bounded queue of frames drained by its own writer
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        # Guards active_connections only; sockets are never awaited while held
+        self._connections_lock = threading.Lock()
+
+        # Setup routes
+        @self.app.get("/")
+        async def get_index(request: Request):
+            # The page is static, so let browsers revalidate instead of refetching it
+            if request.headers.get("if-none-match") == _INDEX_ETAG:
+                return Response(status_code=304, headers=_INDEX_HEADERS)
+            return HTMLResponse(content=_INDEX_BODY, headers=_INDEX_HEADERS)
 
         @self.app.websocket("/ws")
         async def websocket_endpoint(websocket: WebSocket):
             await websocket.accept()
-            self.active_connections.append(websocket)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=_SEND_QUEUE_SIZE)
+            queue.put_nowait(self._snapshot_frame())
+            with self._connections_lock:
+                self.active_connections[websocket] = queue
+            writer = asyncio.create_task(self._send_loop(websocket, queue))
             try:
-                await websocket.send_json(self.state.to_dict())
                 while True:
                     await websocket.receive_text()
             except Exception as e:
                 logging.error(f"WebSocket error: {e}")
             finally:
-                self.active_connections.remove(websocket)
+                writer.cancel()
+                with self._connections_lock:
+                    self.active_connections.pop(websocket, None)
 
         # Start server thread
+        self._server: Optional[uvicorn.Server] = None
+        self._server_ready = threading.Event()
         try:
             logging.info("Starting WebSim server thread...")
             self.server_thread = threading.Thread(target=self._run_server, daemon=True)
             self.server_thread.start()
-            time.sleep(1)
 
-            if self.server_thread.is_alive():
+            # Set once the socket is listening, or when the server thread exits
+            self._server_ready.wait(timeout=5.0)
+            if self._server is not None and self._server.started:
                 # Using ANSI color codes for cyan text and bold
                 logging.info(
                     "\033[1;36mWebSim server started successfully - Open http://localhost:8000 in your browser\033[0m"
@@ -499,6 +593,12 @@ class WebSim(Simulator):
             host="0.0.0.0",  # Still bind to all interfaces
             port=8000,
             log_level="error",
+            # Skip per-request access log records; the log level already hides them
+            access_log=False,
+            # permessage-deflate keeps a compressor per connection, so every
+            # broadcast would be compressed once per client. State frames are
+            # small and served locally, so send them as-is.
+            ws_per_message_deflate=False,
             server_header=False,
             # Override the default startup message
             log_config={
@@ -523,69 +623,99 @@ class WebSim(Simulator):
                 },
             },
         )
-        server = uvicorn.Server(config)
-        server.run()
+        self._server = _NotifyingServer(config, self._server_ready)
+        try:
+            self._server.run()
+        finally:
+            # Unblock __init__ if the server stops or fails to bind
+            self._server_ready.set()
+
+    @staticmethod
+    def _encode_frame(frame_type: str, version: int, state: dict) -> bytes:
+        """Encode a snapshot or patch frame as compact UTF-8 JSON"""
+        frame = {"type": frame_type, "v": version, "state": state}
+        return json.dumps(frame, separators=(",", ":")).encode("utf-8")
+
+    def _snapshot_frame(self) -> bytes:
+        """Full state frame for the current version, encoded at most once"""
+        if self._snapshot_version != self._version:
+            self._snapshot_payload = self._encode_frame(
+                "snapshot", self._version, self._sent_state
+            )
+            self._snapshot_version = self._version
+        return self._snapshot_payload
 
     async def broadcast_state(self):
-        """Broadcast current state to all connected clients"""
-        if not self.active_connections:
+        """Broadcast state changes to all connected clients"""
+        # sim() publishes a new dict rather than mutating this one
+        state = self.state_dict
+
+        changed = {
+            key: value
+            for key, value in state.items()
+            if self._sent_state.get(key) != value
+        }
+        if not changed:
             return
 
-        try:
-
-            # Broadcast to all clients
-            disconnected = []
-            for connection in self.active_connections:
-                try:
-                    await connection.send_json(self.state_dict)
-                except Exception as e:
-                    logging.error(f"Error broadcasting to client: {e}")
-                    disconnected.append(connection)
-
-            for connection in disconnected:
-                try:
-                    self.active_connections.remove(connection)
-                except ValueError:
-                    pass
+        self._version += 1
+        self._sent_state = state
+        payload = self._encode_frame("patch", self._version, changed)
+
+        with self._connections_lock:
+            queues = list(self.active_connections.values())
+
+        # Hand the frame to each client's writer without awaiting any socket
+        for queue in queues:
+            if queue.full():
+                # Skipping a patch would lose changes, so replace the backlog
+                # of a lagging client with one snapshot of the latest state
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait(self._snapshot_frame())
+            else:
+                queue.put_nowait(payload)
 
+    async def _send_loop(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued frames to a single client until it disconnects"""
+        try:
+            while True:
+                frames = [await queue.get()]
+                # Frames queued while the previous send was in flight go out
+                # together as one message, one JSON object per line
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+                await websocket.send_bytes(b"\n".join(frames))
         except Exception as e:
-            logging.error(f"Error in broadcast_state: {e}")
-
-    def get_earliest_time(self, inputs: Dict[str, Input]) -> float:
-        """Get earliest timestamp from inputs"""
-        earliest_time = float("inf")
-        for input_type, input_info in inputs.items():
-            logging.debug(f"GET {input_info}")
-            if input_type == "GovernanceEthereum":
-                continue
-            if input_type == "Universal Laws":
-                continue
-            if input_info.timestamp is not None:
-                if input_info.timestamp < earliest_time:
-                    earliest_time = float(input_info.timestamp)
-        return earliest_time if earliest_time != float("inf") else 0.0
+            logging.error(f"Error sending to client: {e}")
 
     def tick(self) -> None:
-        """Update simulator state"""
-        if self._initialized:
-            try:
-                # Get or create event loop
-                try:
-                    loop = asyncio.get_event_loop()
-                except RuntimeError:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-
-                try:
-                    loop.run_until_complete(self.broadcast_state())
-                except Exception:
-                    loop = asyncio.get_event_loop()
-                    loop.create_task(self.broadcast_state())
+        """Broadcast pending state changes, at most once per tick interval"""
+        if not self._initialized or self._server_loop is None:
+            time.sleep(self._tick_interval)
+            return
 
-            except Exception as e:
-                logging.error(f"Error in tick: {e}")
+        # Wake up periodically so the orchestrator can stop this loop
+        if not self._dirty.wait(timeout=1.0):
+            return
 
-            time.sleep(0.5)
+        # Keep broadcasts a tick interval apart; changes made meanwhile are
+        # sent together. After an idle period this does not wait at all.
+        remaining = self._last_tick + self._tick_interval - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+        self._dirty.clear()
+
+        try:
+            # The websockets belong to the server loop, so broadcast there
+            future = asyncio.run_coroutine_threadsafe(
+                self.broadcast_state(), self._server_loop
+            )
+            future.result(timeout=1.0)
+        except Exception as e:
+            logging.error(f"Error in tick: {e}")
+
+        self._last_tick = time.monotonic()
 
     def sim(self, actions: List[Action]) -> None:
         """Handle simulation updates from commands"""
@@ -594,77 +724,83 @@ class WebSim(Simulator):
             return
 
         try:
-            updated = False
-            with self._lock:
-                earliest_time = self.get_earliest_time(self.io_provider.inputs)
-                logging.debug(f"earliest_time: {earliest_time}")
-
-                input_rezeroed = []
-                for input_type, input_info in self.io_provider.inputs.items():
-                    timestamp = 0
-                    if (
-                        input_type != "GovernanceEthereum"
-                        and input_info.timestamp is not None
-                    ):
-                        timestamp = input_info.timestamp - earliest_time
-                    input_rezeroed.append(
-                        {
-                            "input_type": input_type,
-                            "timestamp": timestamp,
-                            "input": input_info.input,
-                        }
-                    )
-
-                # Process system latency relative to earliest time
-                fuser_end_time = self.io_provider.fuser_end_time or 0
-                llm_start_time = self.io_provider.llm_start_time or 0
-                llm_end_time = self.io_provider.llm_end_time or 0
-
-                system_latency = {
-                    "fuse_time": (
-                        fuser_end_time - earliest_time if fuser_end_time else 0
-                    ),
-                    "llm_start": (
-                        llm_start_time - earliest_time if llm_start_time else 0
-                    ),
-                    "processing": (
-                        llm_end_time - llm_start_time
-                        if (llm_end_time and llm_start_time)
-                        else 0
-                    ),
-                    "complete": llm_end_time - earliest_time if llm_end_time else 0,
-                }
-
-                for action in actions:
-                    if action.type == "move":
-                        new_action = action.value
-                        if new_action != self.state.current_action:
-                            self.state.current_action = new_action
-                            updated = True
-                    elif action.type == "speak":
-                        new_speech = action.value
-                        if new_speech != self.state.last_speech:
-                            self.state.last_speech = new_speech
-                            updated = True
-                    elif action.type == "emotion":
-                        new_emotion = action.value
-                        if new_emotion != self.state.current_emotion:
-                            self.state.current_emotion = new_emotion
-                            updated = True
-
-                self.state_dict = {
-                    "current_action": self.state.current_action,
-                    "last_speech": self.state.last_speech,
-                    "current_emotion": self.state.current_emotion,
-                    "system_latency": system_latency,
-                    "inputs": input_rezeroed,
-                }
-
-                logging.info(f"Inputs and LLM Outputs: {self.state_dict}")
-
-            if updated:
-                self._last_tick = 0
-                self.tick()
+            # Inputs are sent as parallel columns rather than one dict per
+            # input, which keeps the encoded frame small. One pass over the
+            # inputs collects the columns and the earliest anchored timestamp;
+            # the timestamps are rezeroed afterwards.
+            input_types = []
+            raw_timestamps = []
+            input_texts = []
+            earliest_time = float("inf")
+            for input_type, input_info in self.io_provider.inputs.items():
+                timestamp = input_info.timestamp
+                if input_type == "GovernanceEthereum":
+                    timestamp = None
+                elif (
+                    timestamp is not None
+                    and timestamp < earliest_time
+                    and input_type not in _UNANCHORED_INPUTS
+                ):
+                    earliest_time = float(timestamp)
+                input_types.append(input_type)
+                raw_timestamps.append(timestamp)
+                input_texts.append(input_info.input)
+            if earliest_time == float("inf"):
+                earliest_time = 0.0
+            logging.debug("earliest_time: %s", earliest_time)
+
+            # Round to the millisecond precision the page displays, so frames
+            # carry 3 decimals instead of the 17 digits of a full float
+            timestamps = [
+                0 if timestamp is None else round(timestamp - earliest_time, 3)
+                for timestamp in raw_timestamps
+            ]
+            input_rezeroed = {
+                "input_type": input_types,
+                "timestamp": timestamps,
+                "input": input_texts,
+            }
+
+            # Process system latency relative to earliest time
+            fuser_end_time = self.io_provider.fuser_end_time or 0
+            llm_start_time = self.io_provider.llm_start_time or 0
+            llm_end_time = self.io_provider.llm_end_time or 0
+
+            system_latency = {
+                "fuse_time": (fuser_end_time - earliest_time if fuser_end_time else 0),
+                "llm_start": (llm_start_time - earliest_time if llm_start_time else 0),
+                "processing": (
+                    llm_end_time - llm_start_time
+                    if (llm_end_time and llm_start_time)
+                    else 0
+                ),
+                "complete": llm_end_time - earliest_time if llm_end_time else 0,
+            }
+            # Same millisecond display precision as the input timestamps
+            system_latency = {
+                key: round(value, 3) for key, value in system_latency.items()
+            }
+
+            for action in actions:
+                field = _ACTION_FIELDS.get(action.type)
+                if field is not None:
+                    setattr(self.state, field, action.value)
+
+            # Publish with a single assignment; readers on the server loop
+            # always see either the old or the new complete dict
+            self.state_dict = {
+                "current_action": self.state.current_action,
+                "last_speech": self.state.last_speech,
+                "current_emotion": self.state.current_emotion,
+                "system_latency": system_latency,
+                "inputs": input_rezeroed,
+            }
+
+            logging.debug("Inputs and LLM Outputs: %s", self.state_dict)
+
+            # Inputs and latency change every cycle even when the actions
+            # repeat; broadcast_state sends nothing if no key changed
+            self._dirty.set()
 
         except Exception as e:
             logging.error(f"Error in sim update: {e}")
@@ -674,9 +810,12 @@ class WebSim(Simulator):
         logging.info("Cleaning up WebSim...")
         self._initialized = False
 
-        for connection in self.active_connections[:]:
+        with self._connections_lock:
+            connections = list(self.active_connections)
+            self.active_connections.clear()
+
+        for connection in connections:
             try:
                 await connection.close()
             except Exception as e:
                 logging.error(f"Error closing connection: {e}")
-        self.active_connections.clear()
@@ -0,0 +1,142 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from inputs.plugins.wallet_coinbase import Message, WalletCoinbase
+
+
+@pytest.fixture
+def mock_wallet():
+    with (
+        patch("inputs.plugins.wallet_coinbase.Cdp"),
+        patch("inputs.plugins.wallet_coinbase.Wallet") as mock,
+    ):
+        mock_instance = Mock()
+        mock_instance.balance.return_value = "1.0"
+        mock.fetch.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.fixture
+def mock_io_provider():
+    with patch("inputs.plugins.wallet_coinbase.IOProvider") as mock:
+        mock_instance = Mock()
+        mock.return_value = mock_instance
+        yield mock_instance
+
+
+@pytest.fixture
+def wallet_coinbase(mock_wallet, mock_io_provider):
+    env = {
+        "COINBASE_WALLET_ID": "test-wallet",
+        "COINBASE_API_KEY": "test-key",
+        "COINBASE_API_SECRET": "test-secret",
+    }
+    with patch.dict("os.environ", env):
+        return WalletCoinbase()
+
+
+@pytest.fixture
+def poll_balances(wallet_coinbase):
+    """Feed _poll a sequence of balances without sleeping or calling the API."""
+
+    def _set(*balances):
+        wallet_coinbase._fetch_balance = Mock(side_effect=list(balances))
+
+    with patch("inputs.plugins.wallet_coinbase.asyncio.sleep") as sleep:
+        yield _set, sleep
+
+
+def test_init(wallet_coinbase):
+    assert wallet_coinbase.ETH_balance == 1.0
+    assert wallet_coinbase.ETH_balance_previous == 1.0
+    assert wallet_coinbase._pending_sum == 0.0
+
+
+@pytest.mark.asyncio
+async def test_raw_to_text_conversion_balance_change(wallet_coinbase):
+    result = await wallet_coinbase._raw_to_text([1.5, 0.5])
+
+    assert isinstance(result, Message)
+    assert result.delta == 0.5
+    assert isinstance(result.timestamp, float)
+
+
+@pytest.mark.asyncio
+async def test_raw_to_text_ignores_decrease(wallet_coinbase):
+    await wallet_coinbase.raw_to_text([0.5, -0.5])
+
+    assert wallet_coinbase._pending_sum == 0.0
+    assert wallet_coinbase.formatted_latest_buffer() is None
+
+
+@pytest.mark.asyncio
+async def test_deltas_accumulate_across_polls(wallet_coinbase, poll_balances):
+    set_balances, _ = poll_balances
+    set_balances(1.25, 1.75)
+
+    await wallet_coinbase.raw_to_text(await wallet_coinbase._poll())
+    await wallet_coinbase.raw_to_text(await wallet_coinbase._poll())
+
+    assert wallet_coinbase._pending_sum == pytest.approx(0.75)
+
+
+@pytest.mark.asyncio
+async def test_formatted_latest_buffer_flushes_sum(wallet_coinbase):
+    await wallet_coinbase.raw_to_text([1.25, 0.25])
+    await wallet_coinbase.raw_to_text([1.75, 0.5])
+    timestamp = wallet_coinbase._pending_ts
+
+    result = wallet_coinbase.formatted_latest_buffer()
+
+    assert result is not None
+    assert "WalletCoinbase INPUT" in result
+    assert "You just received 0.75000 ETH." in result
+    wallet_coinbase.io_provider.add_input.assert_called_once_with(
+        "WalletCoinbase", "You just received 0.75000 ETH.", timestamp
+    )
+
+    assert wallet_coinbase._pending_sum == 0.0
+    assert wallet_coinbase.formatted_latest_buffer() is None
+    wallet_coinbase.io_provider.add_input.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_idle_multiplier_doubles_and_caps(wallet_coinbase, poll_balances):
+    set_balances, sleep = poll_balances
+    set_balances(*[1.0] * 6)
+
+    for _ in range(6):
+        assert await wallet_coinbase._poll() is None
+
+    assert wallet_coinbase._idle_multiplier == wallet_coinbase.MAX_IDLE_MULTIPLIER
+    assert [call.args[0] for call in sleep.await_args_list] == [
+        0.5,
+        1.0,
+        2.0,
+        4.0,
+        8.0,
+        8.0,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_idle_multiplier_resets_on_change(wallet_coinbase, poll_balances):
+    set_balances, _ = poll_balances
+    set_balances(1.0, 1.0, 1.5)
+
+    await wallet_coinbase._poll()
+    await wallet_coinbase._poll()
+    assert wallet_coinbase._idle_multiplier == 4
+
+    assert await wallet_coinbase._poll() == [1.5, 0.5]
+    assert wallet_coinbase._idle_multiplier == 1
+
+
+@pytest.mark.asyncio
+async def test_raw_to_text_none_is_noop(wallet_coinbase):
+    await wallet_coinbase.raw_to_text(None)
+
+    assert wallet_coinbase._pending_sum == 0.0
+    assert wallet_coinbase.formatted_latest_buffer() is None
+    wallet_coinbase.io_provider.add_input.assert_not_called()
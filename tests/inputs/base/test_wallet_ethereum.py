@@ -1,24 +1,39 @@
+import asyncio
 import time
-from unittest.mock import Mock, patch
+from collections import deque
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from web3 import AsyncHTTPProvider, WebSocketProvider
 
+from inputs.plugins import wallet_ethereum
 from inputs.plugins.wallet_ethereum import Message, WalletEthereum
 
 
+def awaitable(value):
+    async def _value():
+        return value
+
+    return _value()
+
+
 @pytest.fixture
 def mock_web3():
-    with patch("inputs.plugins.wallet_ethereum.Web3") as mock:
+    with patch("inputs.plugins.wallet_ethereum._get_web3") as mock:
         mock_instance = Mock()
-        mock_http_provider = Mock()
-        mock.HTTPProvider.return_value = mock_http_provider
         mock.return_value = mock_instance
-        mock_instance.is_connected.return_value = True
-        mock_instance.from_wei.return_value = 10.0
+        mock_instance.provider.has_persistent_connection = False
         mock_instance.eth = Mock()
+        mock_instance.eth.get_balance = AsyncMock()
         yield mock_instance
 
 
+@pytest.fixture(autouse=True)
+def mock_sleep():
+    with patch("inputs.plugins.wallet_ethereum.asyncio.sleep", new=AsyncMock()):
+        yield
+
+
 @pytest.fixture
 def mock_io_provider():
     with patch("inputs.plugins.wallet_ethereum.IOProvider") as mock:
@@ -27,34 +42,52 @@ def mock_io_provider():
         yield mock_instance
 
 
+TEST_ADDRESS = "0x52908400098527886E0F7030069857D2E4169EE7"
+
+
 @pytest.fixture
 def wallet_eth(mock_web3, mock_io_provider):
-    with patch.dict("os.environ", {"ETH_ADDRESS": "0xTestAddress"}):
+    with patch.dict("os.environ", {"ETH_ADDRESS": TEST_ADDRESS.lower()}):
         return WalletEthereum()
 
 
+@pytest.mark.parametrize(
+    "provider_url, provider_class",
+    [
+        ("https://rpc.example.com", AsyncHTTPProvider),
+        ("http://localhost:8545", AsyncHTTPProvider),
+        ("wss://rpc.example.com", WebSocketProvider),
+        ("ws://localhost:8546", WebSocketProvider),
+    ],
+)
+def test_get_web3_picks_provider_and_caches(provider_url, provider_class):
+    with patch.dict(wallet_ethereum._WEB3_CLIENTS, clear=True):
+        web3 = wallet_ethereum._get_web3(provider_url)
+
+        assert isinstance(web3.provider, provider_class)
+        assert wallet_ethereum._get_web3(provider_url) is web3
+        assert wallet_ethereum._get_web3(provider_url + "/other") is not web3
+
+
 def test_init(wallet_eth, mock_web3, mock_io_provider):
     assert wallet_eth.ETH_balance == 0
-    assert wallet_eth.ETH_balance_previous == 0
-    assert isinstance(wallet_eth.messages, list)
-    assert wallet_eth.ACCOUNT_ADDRESS == "0xTestAddress"
+    assert wallet_eth.balance_wei_previous == 0
+    assert isinstance(wallet_eth.messages, deque)
+    assert wallet_eth.messages.maxlen == 1
+    assert wallet_eth.ACCOUNT_ADDRESS == TEST_ADDRESS
     assert wallet_eth.web3 is not None
-    mock_web3.is_connected.assert_called_once()
 
 
-def test_init_connection_failed(mock_web3):
-    mock_web3.is_connected.return_value = False
-    with pytest.raises(Exception) as exc_info:
+def test_init_invalid_address(mock_web3, mock_io_provider):
+    with pytest.raises(ValueError):
         with patch.dict("os.environ", {"ETH_ADDRESS": "0xTestAddress"}):
             WalletEthereum()
-    assert str(exc_info.value) == "Failed to connect to Ethereum"
 
 
 @pytest.mark.asyncio
 async def test_poll(wallet_eth, mock_web3):
-    mock_web3.eth.block_number = 12345
+    mock_web3.eth.block_number = awaitable(12345)
     mock_web3.eth.get_balance.return_value = 1000000000000000000  # 1 ETH in Wei
-    mock_web3.from_wei.return_value = 1.0
 
     result = await wallet_eth._poll()
     assert isinstance(result, list)
@@ -62,8 +95,157 @@ async def test_poll(wallet_eth, mock_web3):
     assert isinstance(result[0], float)  # current balance
     assert isinstance(result[1], float)  # balance change
 
-    mock_web3.eth.get_balance.assert_called_once_with(wallet_eth.ACCOUNT_ADDRESS)
-    mock_web3.from_wei.assert_called_once()
+    mock_web3.eth.get_balance.assert_awaited_once_with(
+        wallet_eth.ACCOUNT_ADDRESS, 12345
+    )
+    assert wallet_eth.block_number == 12345
+    assert wallet_eth.balance_eth == 1.0
+
+
+@pytest.mark.asyncio
+async def test_poll_skips_balance_on_same_block(wallet_eth, mock_web3):
+    mock_web3.eth.block_number = awaitable(12345)
+    mock_web3.eth.get_balance.return_value = 1000000000000000000
+    await wallet_eth._poll()
+
+    mock_web3.eth.block_number = awaitable(12345)
+    await wallet_eth._poll()
+    mock_web3.eth.get_balance.assert_awaited_once()
+
+    mock_web3.eth.block_number = awaitable(12346)
+    await wallet_eth._poll()
+    assert mock_web3.eth.get_balance.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_poll_balance_change_in_wei(wallet_eth, mock_web3):
+    mock_web3.eth.block_number = awaitable(12345)
+    mock_web3.eth.get_balance.return_value = 10**18
+    with patch("inputs.plugins.wallet_ethereum.random.randint", return_value=0):
+        await wallet_eth._poll()
+
+        mock_web3.eth.block_number = awaitable(12346)
+        mock_web3.eth.get_balance.return_value = 10**18 + 1
+        result = await wallet_eth._poll()
+
+    assert wallet_eth.balance_wei_previous == 10**18 + 1
+    assert result == [(10**18 + 1) / 10**18, 1 / 10**18]
+
+
+@pytest.mark.asyncio
+async def test_poll_rpc_failure_keeps_previous_values(wallet_eth, mock_web3):
+    wallet_eth.ETH_balance = 2.0
+    wallet_eth.balance_change = 0.5
+    mock_web3.eth.block_number = awaitable(12345)
+    mock_web3.eth.get_balance.side_effect = ConnectionError("RPC unreachable")
+
+    result = await wallet_eth._poll()
+
+    assert result == [2.0, 0.5]
+
+
+class FakeSocketProvider:
+    has_persistent_connection = True
+
+    def __init__(self):
+        self.connected = False
+        self.connect_calls = 0
+        self.disconnect_calls = 0
+        # asyncio.sleep is patched out, so connect blocks on events instead
+        self.connecting = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def connect(self):
+        self.connect_calls += 1
+        self.connecting.set()
+        await self.release.wait()
+        self.connected = True
+
+    async def disconnect(self):
+        self.disconnect_calls += 1
+        self.connected = False
+
+
+@pytest.fixture
+def socket_wallets(mock_web3, mock_io_provider):
+    mock_web3.provider = FakeSocketProvider()
+    with (
+        patch.dict(wallet_ethereum._CONNECT_LOCKS, clear=True),
+        patch.dict(wallet_ethereum._CONNECTED_SOCKETS, clear=True),
+        patch.dict("os.environ", {"ETH_ADDRESS": TEST_ADDRESS}),
+    ):
+        yield WalletEthereum(), WalletEthereum()
+
+
+@pytest.mark.asyncio
+async def test_shared_socket_connects_once(socket_wallets, mock_web3):
+    first, second = socket_wallets
+    provider = mock_web3.provider
+    provider.release.clear()
+
+    first_connect = asyncio.create_task(first._ensure_connected())
+    await provider.connecting.wait()
+    second_connect = asyncio.create_task(second._ensure_connected())
+
+    # The first connect is still in flight, so the second caller must wait
+    done, _ = await asyncio.wait({second_connect}, timeout=0.05)
+    assert not done
+    assert second._socket_id is None
+
+    provider.release.set()
+    await asyncio.gather(first_connect, second_connect)
+
+    assert provider.connect_calls == 1
+    assert provider.connected
+    assert first._socket_id == second._socket_id is not None
+
+
+@pytest.mark.asyncio
+async def test_shared_socket_reconnects_after_drop(socket_wallets, mock_web3):
+    first, second = socket_wallets
+    await first._ensure_connected()
+
+    # The socket drops while only the second instance is polling
+    mock_web3.eth.block_number = awaitable(12345)
+    mock_web3.eth.get_balance.side_effect = ConnectionError("socket closed")
+    await second._poll()
+    assert mock_web3.provider.disconnect_calls == 1
+
+    mock_web3.eth.block_number = awaitable(12346)
+    mock_web3.eth.get_balance.side_effect = None
+    mock_web3.eth.get_balance.return_value = 10**18
+    await second._poll()
+
+    assert mock_web3.provider.connect_calls == 2
+    assert second.balance_wei == 10**18
+
+
+@pytest.mark.asyncio
+async def test_shared_socket_stale_failure_keeps_new_socket(socket_wallets, mock_web3):
+    first, second = socket_wallets
+    await first._ensure_connected()
+    await second._ensure_connected()
+
+    # second replaces the socket, then first reports a failure on the old one
+    await second._release_connection()
+    await second._ensure_connected()
+    await first._release_connection()
+
+    assert mock_web3.provider.disconnect_calls == 1
+    assert mock_web3.provider.connected
+
+
+@pytest.mark.asyncio
+async def test_shared_socket_failed_connect_cleans_up(socket_wallets, mock_web3):
+    first, _ = socket_wallets
+    mock_web3.provider.connect = AsyncMock(side_effect=ConnectionError("refused"))
+
+    with pytest.raises(ConnectionError):
+        await first._ensure_connected()
+
+    assert mock_web3.provider.disconnect_calls == 1
+    assert first.PROVIDER_URL not in wallet_ethereum._CONNECTED_SOCKETS
 
 
 @pytest.mark.asyncio
@@ -88,6 +270,7 @@ async def test_raw_to_text_conversion_no_change(wallet_eth):
 async def test_raw_to_text_buffer_management(wallet_eth):
     raw_input = [10.0, 1.0]
     await wallet_eth.raw_to_text(raw_input)
+    await wallet_eth.raw_to_text([11.0, 1.0])
     assert len(wallet_eth.messages) == 1
     assert isinstance(wallet_eth.messages[0], Message)
 
@@ -95,7 +278,7 @@ async def test_raw_to_text_buffer_management(wallet_eth):
 def test_formatted_latest_buffer_with_message(wallet_eth):
     current_time = time.time()
     test_message = Message(timestamp=current_time, message="test balance update")
-    wallet_eth.messages = [test_message]
+    wallet_eth.messages.append(test_message)
 
     result = wallet_eth.formatted_latest_buffer()
 
@@ -0,0 +1,163 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from llm.output_model import Action
+from providers.io_provider import Input
+from simulators.base import SimulatorConfig
+from simulators.plugins.WebSim import WebSim
+
+
+def decode(frame: bytes) -> dict:
+    return json.loads(frame)
+
+
+@pytest.fixture
+def websim():
+    # Skip binding port 8000; the tests drive the app and broadcasts directly
+    with patch.object(WebSim, "_run_server", lambda self: self._server_ready.set()):
+        yield WebSim(SimulatorConfig(name="WebSim"))
+
+
+def add_client(websim: WebSim, maxsize: int = 16) -> asyncio.Queue:
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    websim.active_connections[object()] = queue
+    return queue
+
+
+def test_sim_builds_rezeroed_columns(websim):
+    websim._initialized = True
+    websim.io_provider = Mock(
+        inputs={
+            # Never anchored, always reported at 0
+            "GovernanceEthereum": Input("laws", 50.0),
+            # Rezeroed, but too early to anchor the timeline
+            "Universal Laws": Input("be kind", 90.0),
+            "VLM": Input("a person", 100.1234),
+            "ASR": Input("hello", 101.5),
+            "Untimed": Input("no clock", None),
+        },
+        fuser_end_time=100.6,
+        llm_start_time=100.7,
+        llm_end_time=102.2,
+    )
+
+    websim.sim(
+        [
+            Action(type="move", value="walk"),
+            Action(type="speak", value="hi"),
+            Action(type="emotion", value="happy"),
+            Action(type="unknown", value="ignored"),
+        ]
+    )
+
+    assert websim.state_dict == {
+        "current_action": "walk",
+        "last_speech": "hi",
+        "current_emotion": "happy",
+        "system_latency": {
+            "fuse_time": 0.477,
+            "llm_start": 0.577,
+            "processing": 1.5,
+            "complete": 2.077,
+        },
+        "inputs": {
+            "input_type": [
+                "GovernanceEthereum",
+                "Universal Laws",
+                "VLM",
+                "ASR",
+                "Untimed",
+            ],
+            "timestamp": [0, -10.123, 0.0, 1.377, 0],
+            "input": ["laws", "be kind", "a person", "hello", "no clock"],
+        },
+    }
+    assert websim._dirty.is_set()
+
+
+def test_first_connect_receives_snapshot(websim):
+    websim.state_dict = {**websim.state_dict, "current_action": "walk"}
+    asyncio.run(websim.broadcast_state())
+
+    with TestClient(websim.app) as client:
+        with client.websocket_connect("/ws") as ws:
+            frame = decode(ws.receive_bytes())
+
+    assert frame == {"type": "snapshot", "v": 1, "state": websim.state_dict}
+
+
+@pytest.mark.asyncio
+async def test_broadcast_sends_only_changed_keys(websim):
+    queue = add_client(websim)
+
+    websim.state_dict = {**websim.state_dict, "current_action": "walk"}
+    await websim.broadcast_state()
+    websim.state_dict = {**websim.state_dict, "last_speech": "hello"}
+    await websim.broadcast_state()
+
+    assert decode(queue.get_nowait()) == {
+        "type": "patch",
+        "v": 1,
+        "state": {"current_action": "walk"},
+    }
+    assert decode(queue.get_nowait()) == {
+        "type": "patch",
+        "v": 2,
+        "state": {"last_speech": "hello"},
+    }
+
+
+@pytest.mark.asyncio
+async def test_broadcast_skips_unchanged_state(websim):
+    queue = add_client(websim)
+
+    websim.state_dict = dict(websim.state_dict)
+    await websim.broadcast_state()
+
+    assert queue.empty()
+    assert websim._version == 0
+
+
+@pytest.mark.asyncio
+async def test_broadcast_replaces_full_queue_with_snapshot(websim):
+    lagging = add_client(websim, maxsize=2)
+    lagging.put_nowait(b"stale-1")
+    lagging.put_nowait(b"stale-2")
+    healthy = add_client(websim)
+
+    websim.state_dict = {**websim.state_dict, "current_emotion": "happy"}
+    await websim.broadcast_state()
+
+    assert lagging.qsize() == 1
+    assert decode(lagging.get_nowait()) == {
+        "type": "snapshot",
+        "v": 1,
+        "state": websim.state_dict,
+    }
+    assert decode(healthy.get_nowait())["type"] == "patch"
+
+
+@pytest.mark.asyncio
+async def test_send_loop_joins_queued_frames_with_newlines(websim):
+    websocket = Mock()
+    websocket.send_bytes = AsyncMock()
+    queue: asyncio.Queue = asyncio.Queue()
+    queue.put_nowait(b'{"v":1}')
+    queue.put_nowait(b'{"v":2}')
+
+    writer = asyncio.create_task(websim._send_loop(websocket, queue))
+    await asyncio.sleep(0)
+    queue.put_nowait(b'{"v":3}')
+    await asyncio.sleep(0)
+    writer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await writer
+
+    assert [call.args[0] for call in websocket.send_bytes.await_args_list] == [
+        b'{"v":1}\n{"v":2}',
+        b'{"v":3}',
+    ]